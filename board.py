@@ -6,34 +6,47 @@ Contains the code for the Board class which tracks tile status, mines, adjacent
 Author Paul A Tunis
 
 """
-import random
+from collections import deque
 from math import ceil
 
-# used to find neighboring tile ids
-SHIFT = {
-    0: [-1, -1],
-    1: [-1, 0],
-    2: [-1, 1],
-    3: [0, -1],
-    4: [0, 1],
-    5: [1, -1],
-    6: [1, 0],
-    7: [1, 1]
-}
+import numpy as np
+
+# used to find neighboring tiles, (row shift, col shift) for each of the 8 neighbors
+SHIFT = (
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+    (1, 1)
+)
 
 # used to assign controlled statuses to tiles as they are instantiated and clicked/flagged
+# statuses are stored as small integers so the whole board fits in a single uint8 array
+UNCHECKED = 0
+CHECKED = 1
+FLAGGED = 2
+QUESTION = 3
+
 TILE_STATES = [
-    'unchecked',
-    'checked',
-    'flagged',
-    'question'
+    UNCHECKED,
+    CHECKED,
+    FLAGGED,
+    QUESTION
 ]
 
+PRESS = 'press'       # presses the tile but does not check if, possibly triggering a mind and end gam
+RELEASE = 'release'   # releases the tile without checking it
+CLICK = 'click'       # changes tile status from unchecked to checked, if the tile is a mine, endgame
+FLAG = 'flag'         # also serves to place a question mark if the tile is already flagged
+
 TILE_ACTIONS = [
-    'press',    # presses the tile but does not check if, possibly triggering a mind and end gam
-    'release',  # releases the tile without checking it
-    'click',    # changes tile status from unchecked to checked, if the tile is a mine, endgame
-    'flag',     # also serves to place a question mark if the tile is already flagged
+    PRESS,
+    RELEASE,
+    CLICK,
+    FLAG,
 ]
 
 # min and max board values
@@ -46,19 +59,26 @@ MAX_MINE_RATIO = 0.3    # the maximum percent of mines per total tiles
 
 
 class Board:
-    def __init__(self, width: int, height: int, mines: int) -> None:
+    def __init__(self, width: int, height: int, mines: int, seed: int | None = None) -> None:
         self.width: int = width                 # the width of the board in tiles
         self.height: int = height               # the height of the board in tiles
         self.mine_count: int = mines            # total count of mines
-        self.tiles: list[int] = []              # a list of all tile objects
-        self.tiles_with_mines: list[int] = []   # the tile ids that have mines
-        self.neighbors: dict[int: list] = {}    # maps tiles to their neighbors key = tile id / value = list of neighboring tiles
+        self.tiles_with_mines: np.ndarray = np.empty(0, dtype=np.intp)   # the tile ids that have mines
         self.valid = True                       # turns to false if a mine is clicked
         self.user_won = False                   # turns true when all mines have been correctly found!
+        self.rng = np.random.default_rng(seed)  # random generator used to place mines, seed it for repeatable boards
+        self.unchecked_safe_count: int = 0      # non-mine tiles still to be checked, the user wins when this reaches zero
+        self.flagged_mine_count: int = 0        # mines currently marked with a flag
         # check that the number of mines does not exceed the total tiles
         if self.mine_count / (self.width * self.height) > MAX_MINE_RATIO or self.mine_count / (self.width * self.height) < MIN_MINE_RATIO:
             raise ValueError(f'mines must be beteen {MIN_MINE_RATIO*100}% and {MAX_MINE_RATIO*100}% of total board tiles!\n'
                              f'Current mines: {self.mine_count}, total tiles: {self.width*self.height}')
+
+        # tile data is stored as parallel (height, width) arrays, indexed by [row, col]
+        self.mine: np.ndarray = np.zeros((self.height, self.width), dtype=bool)         # is the tile a mine
+        self.status: np.ndarray = np.zeros((self.height, self.width), dtype=np.uint8)   # state of the tile, one of TILE_STATES
+        self.adjacent: np.ndarray = np.zeros((self.height, self.width), dtype=np.uint8) # the number of adjacent mines
+        self.pressed: np.ndarray = np.zeros((self.height, self.width), dtype=bool)      # if the tile is pressed by the mouse
         
         self.tile_pressed = False
         self.current_pressed_tile: int = -1
@@ -78,19 +98,16 @@ class Board:
         Clear the existing gameboard
         """
         self.user_won = False
-        self.tiles.clear()
-        self.tiles_with_mines.clear()
-        self.neighbors.clear()
+        self.tiles_with_mines = np.empty(0, dtype=np.intp)
+        self.tile_pressed = False
+        self.current_pressed_tile = -1
 
     def reset_mines(self) -> None:
         """
         Reset mines back to normal, unchecked stat, reassign mines and map neighbors
         """
-        for tile in self.tiles:
-            tile.mine = False 
-            tile.status = TILE_STATES[0]
-            tile.adjacent_mines = 0
-        self.neighbors.clear()
+        self.mine.fill(False)
+        self.status.fill(UNCHECKED)
         self._assign_mines()
         self._map_neighbors()
 
@@ -132,123 +149,188 @@ class Board:
             raise ValueError(f'{action} is not a valid action to perform against a tile')
 
         if flag_only:
-            action = TILE_ACTIONS[3]
-
-        # get the tile_id we are performing the tile against        
-        if 'tile_id' in kwargs and action != TILE_ACTIONS[1]:
-            tile_id = int(kwargs['tile_id'])
-        elif 'row' in kwargs and 'col' in kwargs and action != TILE_ACTIONS[1]:
-            tile_id = self.get_tile_id_by_row_and_col(kwargs['row'], kwargs['col'])
-            if tile_id is None:
+            action = FLAG
+
+        # get the row and col we are performing the action against
+        if 'tile_id' in kwargs and action != RELEASE:
+            row, col = divmod(int(kwargs['tile_id']), self.width)
+        elif 'row' in kwargs and 'col' in kwargs and action != RELEASE:
+            row, col = kwargs['row'], kwargs['col']
+            if not (0 <= row < self.height and 0 <= col < self.width):
                 return           
-        elif action == TILE_ACTIONS[1]:
+        elif action == RELEASE:
             self._release_tiles()
             return
         else:
             raise ValueError('You must specify either a tile id, or a row and col pair')
 
-        # if the tile is flagged on question mark, already checked, we won the game, or the board is not valid, then actions do nothing
-        if self.tiles[tile_id].status != TILE_STATES[0] and action != TILE_ACTIONS[3] or not self.valid or self.user_won:
-            self._release_tiles()
-            return
-
         # pressing a tile
-        if action == TILE_ACTIONS[0]:
-            self._press_tile(tile_id)
+        if action == PRESS:
+            self.press_tile(row, col)
             return
 
         # clicking a tile
-        if action == TILE_ACTIONS[2]:
-            self._click_tile(tile_id)
-            self._release_tiles()
+        if action == CLICK:
+            self.click_tile(row, col)
             return
 
         # flagging / question mark a tile
-        if action == TILE_ACTIONS[3]:
-            self._flag_tile(tile_id)
+        if action == FLAG:
+            self.flag_tile(row, col)
             return
 
-    def _press_tile(self, tile_id) -> None:
+    def press_tile(self, row: int, col: int) -> bool:
+        """
+        Presses the tile at row, col without the keyword dispatch of tile_action, the row and col must be on the board.
+        Returns False if the press was ignored
+        """
+        # if the tile is flagged on question mark, already checked, we won the game, or the board is not valid, then actions do nothing
+        if self.status[row, col] != UNCHECKED or not self.valid or self.user_won:
+            self._release_tiles()
+            return False
+
+        self._press_tile(row, col)
+        return True
+
+    def click_tile(self, row: int, col: int) -> bool:
+        """
+        Clicks the tile at row, col without the keyword dispatch of tile_action, the row and col must be on the board.
+        Returns False if the click was ignored
+        """
+        if self.status[row, col] != UNCHECKED or not self.valid or self.user_won:
+            self._release_tiles()
+            return False
+
+        self._click_tile(row, col)
         self._release_tiles()
-        self.tiles[tile_id].pressed = True
+        return True
+
+    def flag_tile(self, row: int, col: int) -> bool:
+        """
+        Flags or question marks the tile at row, col without the keyword dispatch of tile_action, the row and col must
+        be on the board. Returns False if the flag was ignored
+        """
+        if not self.valid or self.user_won:
+            self._release_tiles()
+            return False
+
+        self._flag_tile(row, col)
+        return True
+
+    def _press_tile(self, row: int, col: int) -> None:
+        self._release_tiles()
+        self.current_pressed_tile = row*self.width + col
+        self.pressed[row, col] = True
         self.tile_pressed = True
 
     def _release_tiles(self) -> None:
+        # only one tile can be pressed at a time, so there is no need to clear the whole board
+        if self.current_pressed_tile >= 0:
+            self.pressed.flat[self.current_pressed_tile] = False
         self.tile_pressed = False
         self.current_pressed_tile = -1
-        for tile in self.tiles:
-            tile.pressed = False
 
-    def _click_tile(self, tile_id: int) -> None:
+    def _click_tile(self, row: int, col: int) -> None:
         """
         Clicks the specified tile and changes it to 'checked', then checks if the game is still valid, which means the tile in 
         question was not a mine
         """
         self._release_tiles()
         
-        self.tiles[tile_id].status = TILE_STATES[1]
+        self.status[row, col] = CHECKED
         
         # if its a mine, then game over
-        if self.tiles[tile_id].mine:
-            pass
+        if self.mine[row, col]:
+            self.valid = False
+            return
+
+        self.unchecked_safe_count -= 1
         
         # if the tile has zero adjacent mines, we need to clear out all neighboring zero adjancent mine tiles
-        elif self.tiles[tile_id].adjacent_mines == 0:
-            self._find_zero_adjacent_neighboring_tiles(tile_id)
-        
-        # now check if we have any checked mines for game over
-        self._check_validity()
+        if self.adjacent[row, col] == 0:
+            self._find_zero_adjacent_neighboring_tiles(row, col)
         
         # check if we've won
         self._check_win()
 
-    def _flag_tile(self, tile_id: int) -> None:
+    def _flag_tile(self, row: int, col: int) -> None:
 
         # flip to flagged
-        if self.tiles[tile_id].status == TILE_STATES[0]:
-            self.tiles[tile_id].status = TILE_STATES[2]
+        if self.status[row, col] == UNCHECKED:
+            self.status[row, col] = FLAGGED
+            self.flagged_mine_count += int(self.mine[row, col])
             return
         
         # flip to question mark
-        if self.tiles[tile_id].status == TILE_STATES[2]:
-            self.tiles[tile_id].status = TILE_STATES[3]
+        if self.status[row, col] == FLAGGED:
+            self.status[row, col] = QUESTION
+            self.flagged_mine_count -= int(self.mine[row, col])
             return
         
         # flip back to unchecked
-        if self.tiles[tile_id].status == TILE_STATES[3]:
-            self.tiles[tile_id].status = TILE_STATES[0]
+        if self.status[row, col] == QUESTION:
+            self.status[row, col] = UNCHECKED
             return
     
     def get_flagged_mine_count(self) -> int:
-        return len([mine_tile for mine_tile in self.tiles_with_mines if self.tiles[mine_tile].status == TILE_STATES[2]])
+        return self.flagged_mine_count
+
+    def snapshot(self) -> tuple:
+        """
+        Copies the current game state so it can be put back later with restore, e.g. while a solver searches ahead.
+        Each array is copied with a single memcpy rather than deep copying the board
+        """
+        return (self.mine.copy(), self.status.copy(), self.adjacent.copy(), self.tiles_with_mines.copy(), self.valid,
+                self.user_won, self.unchecked_safe_count, self.flagged_mine_count)
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        Puts back a game state taken with snapshot, copying into the existing arrays. The board size must not have
+        changed since the snapshot was taken
+        """
+        mine, status, adjacent, tiles_with_mines, valid, user_won, unchecked_safe_count, flagged_mine_count = snapshot
+        # check every array before touching anything so a mismatched snapshot leaves the board as it was
+        for array in (mine, status, adjacent):
+            if array.shape != self.mine.shape:
+                raise ValueError(f'snapshot board size {array.shape} does not match the current board size {self.mine.shape}')
+        self.valid = valid
+        self.user_won = user_won
+        self.unchecked_safe_count = unchecked_safe_count
+        self.flagged_mine_count = flagged_mine_count
+        np.copyto(self.mine, mine)
+        np.copyto(self.status, status)
+        np.copyto(self.adjacent, adjacent)
+        self.tiles_with_mines = tiles_with_mines.copy()
+        self._release_tiles()
 
     def _create_tiles(self) -> None:
         """
-        Creates all tile objects on the board
+        Allocates the tile arrays for the current board width and height, reusing the existing arrays when the
+        board size has not changed
         """
-        total_tiles = self.width * self.height
-        row_count = 0
-        col_count = 0
-        for tile_id in range(total_tiles):
-            if col_count > self.width-1:
-                col_count = 0
-                row_count += 1
-            
-            new_tile = Tile()
-            new_tile.id = tile_id
-            new_tile.row = row_count
-            new_tile.col = col_count
-            self.tiles.append(new_tile)
-            col_count += 1
+        shape = (self.height, self.width)
+        if self.mine.shape == shape:
+            self.mine.fill(False)
+            self.status.fill(UNCHECKED)
+            self.pressed.fill(False)
+            return
+
+        self.mine = np.zeros(shape, dtype=bool)
+        self.status = np.zeros(shape, dtype=np.uint8)
+        self.adjacent = np.zeros(shape, dtype=np.uint8)
+        self.pressed = np.zeros(shape, dtype=bool)
 
     def _assign_mines(self) -> None:
         """
         Randomly assigns mines to tiles on the board
         """
-        self.tiles_with_mines = random.sample(range(0, len(self.tiles)-1), self.mine_count)
-        for tile in self.tiles:
-            if tile.id in self.tiles_with_mines:
-                tile.mine = True
+        self.tiles_with_mines = self.rng.choice(self.width*self.height, size=self.mine_count, replace=False)
+        # a single fancy-indexed write marks every mine, no per-tile membership test needed
+        self.mine.flat[self.tiles_with_mines] = True
+
+        # every tile starts unchecked and unflagged once the mines are placed
+        self.unchecked_safe_count = self.width*self.height - self.mine_count
+        self.flagged_mine_count = 0
 
     def _map_neighbors(self) -> None:
         """ 
@@ -259,96 +341,73 @@ class Board:
         r   [3] [t] [4]
         r+1 [5] [6] [7]
 
+        Rather than visiting each tile, the whole mine array is shifted once per neighbor position and summed,
+        with the overlapping slices clipped at the board edges
         """
-        for tile in self.tiles:
-            row = tile.row
-            col = tile.col
-
-            if tile.mine:
-                continue
-
-            if tile.id not in self.neighbors:
-                self.neighbors[tile.id] = []
-
-            for i in range(8):
-                row_check = row + SHIFT[i][0]         
-                col_check = col + SHIFT[i][1]
-
-                # make sure the iterator falls outside of the board
-                if 0 <= row_check < self.height and 0 <= col_check < self.width:
-                    # get the id of the tile
-                    neighboring_tile = self.get_tile_id_by_row_and_col(row_check, col_check)
-
-                    if neighboring_tile is None:
-                        continue
-
-                    self.neighbors[tile.id].append(neighboring_tile)
-
-            tile.adjacent_mines = len([neighboring_tile for neighboring_tile in self.neighbors[tile.id] if neighboring_tile in self.tiles_with_mines])
-
-    def _find_zero_adjacent_neighboring_tiles(self, tile_id: int, maximum_iters: int = 1e7) -> None:
-        """
-        Clears out sections of connected tiles with no adjacent mines
-        """
-        tiles_to_check = [tile_id]
-        current_iter = 0
-        while True:
-            # break out of the loop if we have checked them all
-            if len(tiles_to_check) == 0:
-                break
-
-            # run time catch to avoid an infinite loop
-            current_iter += 1                   
-            if current_iter >= maximum_iters:
-                raise RuntimeWarning(f'Exceeded runtime iterations of {maximum_iters} during _find_zero_adjacent_neighboring tiles_mod')  
+        height, width = self.height, self.width
+        mines = self.mine.view(np.uint8)    # bool and uint8 share a layout, so this reinterprets rather than copies
+        self.adjacent.fill(0)
+        for row_shift, col_shift in SHIFT:
+            self.adjacent[max(0, -row_shift):height-max(0, row_shift), max(0, -col_shift):width-max(0, col_shift)] += \
+                mines[max(0, row_shift):height-max(0, -row_shift), max(0, col_shift):width-max(0, -col_shift)]
 
-            temp_list = []
-            for tile_id in tiles_to_check:
-                for neighbor_tile_id in self.neighbors[tile_id]:
+        # mines do not track their adjacent mines
+        self.adjacent[self.mine] = 0
 
-                    # skip mines
-                    if self.tiles[neighbor_tile_id].mine:
-                        continue
-
-                    # skip ones that have already been checked
-                    if self.tiles[neighbor_tile_id].status == TILE_STATES[1]:
-                        continue
- 
-                    # otherwise, check the tile and if it also has zero adjacent mines, add it to the temp list
-                    self.tiles[neighbor_tile_id].status = TILE_STATES[1]
-                    if self.tiles[neighbor_tile_id].adjacent_mines == 0:
-                        temp_list.append(neighbor_tile_id)
-            
-            # reset the tiles to check and loop around
-            tiles_to_check = temp_list
-
-    def _check_validity(self):
+    def _find_zero_adjacent_neighboring_tiles(self, row: int, col: int) -> None:
         """
-        Checks that we have not clicked a mine!
+        Clears out sections of connected tiles with no adjacent mines using a scanline flood fill.
+        Each seed is expanded to the full run of zero tiles along its row, that run plus a one tile border is checked
+        in a single slice, and any unvisited runs touching it in the rows above and below become new seeds
         """
-        for tile in self.tiles:
-            if tile.mine and tile.status == TILE_STATES[1]:
-                self.valid = False
-                break
+        height, width = self.height, self.width
+        fillable = (self.adjacent == 0) & ~self.mine
+
+        # first and last column of the run of zero tiles each tile belongs to, worked out for the whole board at once
+        cols = np.arange(width)
+        run_start = (np.maximum.accumulate(np.where(fillable, -1, cols), axis=1) + 1).tolist()
+        run_end = (np.minimum.accumulate(np.where(fillable, width, cols)[:, ::-1], axis=1)[:, ::-1] - 1).tolist()
+        fillable = fillable.tolist()
+
+        filled = set()  # (row, first column) of every run that has been expanded
+        seeds = deque([(row, col)])
+
+        while seeds:
+            row, col = seeds.popleft()
+            left = run_start[row][col]
+            if (row, left) in filled:
+                continue
+            filled.add((row, left))
+            right = run_end[row][col]
+
+            # every tile touching the run is safe, so check the run and its border on this row and the rows around it
+            first_col = max(0, left-1)
+            last_col = min(width-1, right+1)
+            first_row = max(0, row-1)
+            last_row = min(height-1, row+1)
+            border = self.status[first_row:last_row+1, first_col:last_col+1]
+            self.unchecked_safe_count -= np.count_nonzero(border != CHECKED)
+            border[:] = CHECKED
+
+            # seed each unvisited run of zero tiles in the rows above and below, jumping over whole runs at a time
+            for neighbor_row in (row-1, row+1):
+                if not first_row <= neighbor_row <= last_row:
+                    continue
+                neighbor_col = first_col
+                while neighbor_col <= last_col:
+                    if fillable[neighbor_row][neighbor_col]:
+                        if (neighbor_row, run_start[neighbor_row][neighbor_col]) not in filled:
+                            seeds.append((neighbor_row, neighbor_col))
+                        neighbor_col = run_end[neighbor_row][neighbor_col] + 1
+                    neighbor_col += 1
 
     def _check_win(self):
         """
         The user needs to un-check all tiles that are not mines
         """
-        # check every tile, if any non-mine tiles are still unchecked, the game is not over!
-        for tile in self.tiles:
-            if not tile.mine and tile.status != TILE_STATES[1]:
-                return
+        # if any non-mine tiles are still unchecked, the game is not over!
+        if self.unchecked_safe_count > 0:
+            return
             
         # otherwise, all non-mine tiles are checked
         self.user_won = True
-    
-
-class Tile:
-    id: int = 0                     # id of tile as position in board tile set
-    mine: bool = False              # is the tile a mine
-    pressed: bool = False           # if the current tile is pressed by the mouse
-    status: str = TILE_STATES[0]    # state of the tile
-    adjacent_mines: int = 0         # the number of adjacent mines
-    row: int = 0                    # the row of the tile
-    col: int = 0                    # the column of the tile
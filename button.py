@@ -6,7 +6,6 @@ Button objects and data for minesweeper, helps determine if a button was pressed
 Author Paul A Tunis
 """
 
-from math import sqrt
 from settings import *
 from typing import Optional
 
@@ -31,50 +30,64 @@ class Button:
             self.image_game_over = image_game_over
         self.display: str = display
         self.size: tuple[float] =(self.image_normal.get_width(), self.image_normal.get_height())
-        self.pos: list[float] = pos
-        if center[0]:
-            self.pos[0] -= self.size[0]/2
-        if center[1]:
-            self.pos[1] -= self.size[1]/2
+        self.pos: list[float] = [pos[0] - self.size[0]/2 if center[0] else pos[0],
+                                 pos[1] - self.size[1]/2 if center[1] else pos[1]]
         if shape not in BUTTON_SHAPES:
             raise ValueError(f'button shape specified must be {BUTTON_SHAPES}')
         self.shape: str = shape
+        # the shape never changes, so pick its hit test once instead of checking the shape on every mouse event
+        if self.shape == BUTTON_SHAPES[0]:
+            self.point_in_button = self._determine_point_in_rectangle
+        else:
+            self.point_in_button = self._determine_point_in_circle
         self.text_to_display: None | str = text_to_display
         self.text_size: None | int = text_size 
         self.font: None | str = font
         self.text_color: tuple = text_color
         self.pressed: bool = False
+
+    @property
+    def pos(self) -> list[float]:
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos: list[float]) -> None:
+        """
+        Sets the top left position of the button and caches its bounding box edges and circle center for the collision checks
+        """
+        self._pos: list[float] = pos
+        self.x0: float = pos[0]
+        self.y0: float = pos[1]
+        self.x1: float = pos[0] + self.size[0]
+        self.y1: float = pos[1] + self.size[1]
+        self.center_x: float = pos[0] + self.size[0]*0.5
+        self.center_y: float = pos[1] + self.size[1]*0.5
+        self.radius_sq: float = (self.size[0]*0.5)**2
         
     def check_collide(self, point: tuple[float], flip: bool = False) -> bool:
         """
         Checks if the given point (x, y) falls inside the button and if true, 'presses' the button.
         Returns true or false
         """
-        if self.shape == BUTTON_SHAPES[0]:
-            if self._determine_point_in_rectangle(point):
-                if flip:
-                    self.pressed = not self.pressed
-                else:
-                    self.pressed = True
-                return True
-        elif self.shape == BUTTON_SHAPES[1]:
-            if self._determine_point_in_circle(point):
-                if flip:
-                    self.pressed = not self.pressed
-                else:
-                    self.pressed = True
-                return True
+        if self.point_in_button(point):
+            if flip:
+                self.pressed = not self.pressed
+            else:
+                self.pressed = True
+            return True
         return False
 
     def get_bounding_box(self) -> tuple[float, float, float, float]:
         return (self.pos[0], self.pos[1], self.size[0], self.size[1])
 
     def _determine_point_in_rectangle(self, point: tuple[float]) -> bool:
-        return self.pos[0] < point[0] < self.pos[0] + self.size[0] and self.pos[1] < point[1] < self.pos[1] + self.size[1]
+        return self.x0 < point[0] < self.x1 and self.y0 < point[1] < self.y1
 
     def _determine_point_in_circle(self, point: tuple[float]) -> bool:
         """ 
         finding if a point is in a circle
         (x - center_x)² + (y - center_y)² < radius².
         """
-        return sqrt((point[0] - (self.pos[0] + self.size[0]/2))**2 + (point[1] - (self.pos[1] + self.size[0]/2))**2) < self.size[0]/2
+        dx = point[0] - self.center_x
+        dy = point[1] - self.center_y
+        return dx*dx + dy*dy < self.radius_sq
@@ -7,12 +7,12 @@ Author Paul A Tunis
 """
 
 # standard libraries
-import datetime
 import time
 import sys
 from typing import Tuple, Optional
 
 # external dependencies
+import numpy as np
 import pygame
 from pygame.locals import *
 
@@ -26,12 +26,23 @@ pygame.font.init()
 
 class MineSweeper:
     def __init__(self):
+        # pygame has to be running before the display mode is set and any resources are loaded for it
+        pygame.init()
+
         # set up screen and object sizes
         self.caption: str = "Minesweeper-Py"
         self.fps: int = 24
         self.clock = pygame.time.Clock()
         self.user: User = User()
         self.tile_start_pos: list = [0, 0]
+        self.tile_positions: list[tuple[float, float]] = []  # top left screen position of each tile, indexed by tile id
+        self.full_redraw: bool = True  # forces the whole screen to be drawn on the next frame
+        self.drawn_frame_state: tuple = ()  # display, board validity, win state, board shape and tile size of the last full draw
+        self.drawn_status: None | np.ndarray = None  # copy of the board tile status as of the last drawn frame
+        self.drawn_pressed: None | np.ndarray = None  # copy of the board pressed tiles as of the last drawn frame
+        self.drawn_button_state: tuple = ()  # pressed state of every button as of the last time they were drawn
+        self.drawn_mines_remaining: str = ''  # digits shown on the mine counter
+        self.drawn_game_seconds: int = -1  # whole seconds shown on the timer
         
         # create screen
         icon = pygame.image.load('resources/mine.png')
@@ -51,9 +62,16 @@ class MineSweeper:
 
         # set up variables to track time and current status
         self.start_time: float = 0.0
+        self.game_date: str = ''  # date the current game started, saved with its result
         self.current_game_time: float = 0.0
+        self.game_seconds: int = 0  # current game time rounded to the whole seconds the timer shows
         self.game_started: bool = False
         self.paused: bool = True  # used to pause inbetween games when we win or loose
+
+        # mouse state for the settings menu, read once per frame and shared by every event handled in that frame
+        self.mouse_pos: tuple[int, int] = (0, 0)
+        self.mouse_left_down: bool = False
+        self.last_pressed_cell: None | tuple[int, int] = None  # tile pressed by the held left button, so dragging only presses new tiles
         
         # ties buttons to images, positions, etc.
         self.button_mapping: dict[str: Button] = {}
@@ -62,12 +80,28 @@ class MineSweeper:
         
         # load graphic resources
         self.tile_unchecked: None | pygame.Surface = None
+        self.tile_unchecked_pressed: None | pygame.Surface = None
         self.tile_checked: None | pygame.Surface = None
         self.tile_flagged: None | pygame.Surface = None
         self.tile_question: None | pygame.Surface = None
         self.tile_mine_checked: None | pygame.Surface = None
         self.mine: None | pygame.Surface = None
+        self.mine_offset: tuple[float, float] = (0.0, 0.0)  # offset that centers the mine image within a tile
         self.segment_display: None | pygame.Surface = None        
+        self.digit_surfaces: list[pygame.Surface] = []  # seven segment digits 0-9 on the counter background, indexed by the digit
+        self.board_background: None | pygame.Surface = None  # game display with all tiles unchecked and empty counters, see _render_board_background
+        self.tile_resources: tuple[pygame.Surface, ...] = ()   # tile image for each tile status, indexed by the status value
+        self.fonts: dict[tuple[str, int], pygame.font.Font] = {}  # system fonts by name and size
+        self.text_surfaces: dict[tuple, pygame.Surface] = {}  # rendered text by message, font, size, colour and bounding box size
+        self.number_surfaces: list[None | tuple[pygame.Surface, tuple[float, float]]] = []  # rendered adjacent mine number and its offset within a tile, indexed by the number
+        self.wrong_flag_surface: None | tuple[pygame.Surface, tuple[float, float]] = None  # rendered X for wrong flags and its offset within a tile
+
+        # header counter positions
+        self.mines_rect: None | pygame.Rect = None
+        self.time_rect: None | pygame.Rect = None
+        self.mines_digits_x: None | float = None
+        self.time_digits_x: None | float = None
+        self.counter_digits_y: None | float = None
 
         # settings menu positions
         self.settings_submenu_width: None | float = None
@@ -90,6 +124,7 @@ class MineSweeper:
         self.mine_slider_y: None | float = None
 
         # create buttons, initialize positions and load image resources
+        self._determine_header_positions()
         self._determine_settings_positions()
         self._map_buttons()
         self._load_resources()
@@ -106,12 +141,21 @@ class MineSweeper:
     def event_loop(self) -> None:
         if not self.board.user_won and self.board.valid and not self.paused:
             self.current_game_time = time.time() - self.start_time
+            self.game_seconds = int(round(self.current_game_time))
 
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        self.mouse_pos = pygame.mouse.get_pos()
+        self.mouse_left_down = pygame.mouse.get_pressed()[0]
+
+        for event in events:
             # quit the game
             if event.type == QUIT:
                 self.terminate_game()
 
+            # the window contents were lost, so everything must be drawn again
+            if event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                self.full_redraw = True
+
             # events for the main game board
             if self.current_display == DISPLAYS[0]:
                 self.game_event(event)
@@ -119,35 +163,42 @@ class MineSweeper:
             elif self.current_display == DISPLAYS[1]:
                 self.settings_event(event)
 
-    def game_event(self, event: pygame.event) -> None:
+        # the game can only end from an event, so checking once all of this frame's events are handled is enough
+        if self.current_display == DISPLAYS[0]:
+            self._save_finished_game()
+
+    def _save_finished_game(self) -> None:
+        """
+        Saves the result of the game once it has been won or lost, and pauses until the next game starts
+        """
         # save the game if we loose
         if not self.board.valid and not self.paused:
             self.paused = True
-            self.user.save_game(self.user.current_game,datetime.datetime.today().strftime('%m-%d-%Y'), self.current_game_time, False)
+            self.user.save_game(self.user.current_game,self.game_date, self.current_game_time, False)
 
         # save the game if we win
         if self.board.user_won and not self.paused:
             self.paused = True
-            self.user.save_game(self.user.current_game,datetime.datetime.today().strftime('%m-%d-%Y'), self.current_game_time, True)
-        
-        # get the current position of the mouse
-        x, y = pygame.mouse.get_pos()
+            self.user.save_game(self.user.current_game,self.game_date, self.current_game_time, True)
 
-        # flag the tile
-        if event.type == MOUSEBUTTONDOWN and event.button == MOUSE_RIGHT and y > HEADER_HEIGHT:
-            row, col = self._find_clicked_tile((x, y)) # what tile is the mouse in?
-            self.board.tile_action(action=TILE_ACTIONS[3], row=row, col=col)
+    def game_event(self, event: pygame.event) -> None:
+        # flag the tile, mouse button events carry the position they happened at
+        if event.type == MOUSEBUTTONDOWN and event.button == MOUSE_RIGHT and event.pos[1] > HEADER_HEIGHT:
+            row, col = self._find_clicked_tile(event.pos) # what tile is the mouse in?
+            self.board.tile_action(action=FLAG, row=row, col=col)
             return
 
         # when we click down on the tile, and hold it, it will be 'pressed'
-        if pygame.mouse.get_pressed()[0]:
+        if event.type == MOUSEBUTTONDOWN and event.button == MOUSE_LEFT:
+            x, y = event.pos
+            self.last_pressed_cell = None
             if y > HEADER_HEIGHT:
-                row, col = self._find_clicked_tile((x, y)) # what tile is the mouse in?
-                self.board.tile_action(action=TILE_ACTIONS[0], flag_only=self.button_mapping['flag_only'].pressed, row=row, col=col)
+                self._press_tile_at(event.pos)
             else:
                 # check if it's in the circle for the new game button
                 if self.button_mapping['new_game'].check_collide((x, y)):
                     self.start_time = time.time()
+                    self.game_date = time.strftime('%m-%d-%Y')
                     self.board.setup()
                     self.paused = False
                 # check if it's in the circle for the settings / stat screen
@@ -158,28 +209,43 @@ class MineSweeper:
                     self.current_display = DISPLAYS[1]
                 elif self.button_mapping['flag_only'].check_collide((x, y), flip=True):
                     pass
+
+        # dragging with the button held moves the press along, but only when the mouse reaches a different tile
+        elif event.type == MOUSEMOTION and event.buttons[0] and event.pos[1] > HEADER_HEIGHT:
+            self._press_tile_at(event.pos)
                 
         # when we release the button we will click any tile we are hovering over
-        elif event.type == MOUSEBUTTONUP and self.board.tile_pressed:
-            if y > HEADER_HEIGHT:
-                row, col = self._find_clicked_tile((x, y)) # what tile is the mouse in?
-                self.board.tile_action(action=TILE_ACTIONS[2], flag_only=self.button_mapping['flag_only'].pressed, row=row, col=col)
+        elif event.type == MOUSEBUTTONUP and event.button == MOUSE_LEFT and self.board.tile_pressed:
+            self.last_pressed_cell = None
+            if event.pos[1] > HEADER_HEIGHT:
+                row, col = self._find_clicked_tile(event.pos) # what tile is the mouse in?
+                self.board.tile_action(action=CLICK, flag_only=self.button_mapping['flag_only'].pressed, row=row, col=col)
                 # if the game hasn't started yet (typically since we've just loaded the program), start it now
                 if self.paused:
                     self.start_time = time.time()
+                    self.game_date = time.strftime('%m-%d-%Y')
                     self.paused = False
             else:
-                self.board.tile_action(TILE_ACTIONS[1], flag_only=self.button_mapping['flag_only'].pressed)
+                self.board.tile_action(RELEASE, flag_only=self.button_mapping['flag_only'].pressed)
                 self.user._load_game_data()
 
         self.button_mapping['new_game'].pressed = self.board.tile_pressed
 
+    def _press_tile_at(self, mouse_pos: tuple) -> None:
+        """
+        Presses the tile under the mouse unless it is the tile the held button already pressed
+        """
+        row, col = self._find_clicked_tile(mouse_pos) # what tile is the mouse in?
+        if (row, col) != self.last_pressed_cell:
+            self.board.tile_action(action=PRESS, flag_only=self.button_mapping['flag_only'].pressed, row=row, col=col)
+            self.last_pressed_cell = (row, col)
+
     def settings_event(self, event: pygame.event) -> None:
         # get the current position of the mouse
-        x, y = pygame.mouse.get_pos()
+        x, y = self.mouse_pos
         return_to_game = False
         # check if we pressed a button
-        if pygame.mouse.get_pressed()[0]:
+        if self.mouse_left_down:
             if self.button_mapping['return'].check_collide((x, y)):
                 self.button_mapping['return'].pressed = True
                 return
@@ -257,6 +323,7 @@ class MineSweeper:
         if return_to_game:
             # reset the board, tile size and resources
             self.start_time = time.time()
+            self.game_date = time.strftime('%m-%d-%Y')
             self.board.setup()
             self._determine_screen_board_size()
             self._load_resources()
@@ -264,131 +331,193 @@ class MineSweeper:
             self.current_display = DISPLAYS[0]
 
     def setup_window(self) -> None:
-        pygame.init()
         pygame.display.set_caption(self.caption)
 
     def update_display(self) -> None:
-        self.draw_layout()
-        self.draw_stats()
+        # anything other than the header and tiles changing, or a finished game changing tiles, needs the whole screen drawn
+        frame_state = (self.current_display, self.board.valid, self.board.user_won, self.board.status.shape, self.user.tile_size)
+        dirty_tiles = self._find_dirty_tiles()
+        if frame_state != self.drawn_frame_state or self.current_display == DISPLAYS[1] or dirty_tiles is None:
+            self.full_redraw = True
+        elif dirty_tiles and (not self.board.valid or self.board.user_won):
+            self.full_redraw = True
+
+        if self.full_redraw:
+            self.full_redraw = False
+            self.drawn_frame_state = frame_state
+            self.draw_layout()
+            self.draw_stats()
+            self.draw_buttons()
+            self.draw_counters()
+            self.draw_tiles()   
+            self.draw_mines()    
+            if self.board.user_won and self.current_display == DISPLAYS[0]:
+                self.draw_text('YOU WON!!!', text_pos=(self.screen.get_width()/2, self.screen.get_height()/2), text_size=60)
+            pygame.display.update()
+        else:
+            dirty_rects = self.draw_header()
+            dirty_rects.extend(self.draw_tiles(dirty_tiles))
+            # an idle frame has nothing to push to the window
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        self.clock.tick(self.fps)
+
+    def draw_header(self) -> list[pygame.Rect]:
+        """
+        Draws the parts of the game display header (buttons and counters) that changed since they were last drawn,
+        returns the areas of the screen that were drawn
+        """
+        # the counters cover their own area, so when no button changed only they need a look
+        if tuple(button.pressed for button in self.button_mapping.values()) == self.drawn_button_state:
+            return self.draw_counters(changed_only=True)
+
+        header_rect = pygame.Rect(0, 0, self.screen.get_width(), HEADER_HEIGHT)
+        self.screen.blit(self.board_background, header_rect, header_rect)
         self.draw_buttons()
         self.draw_counters()
-        self.draw_tiles()   
-        self.draw_mines()    
-        if self.board.user_won and self.current_display == DISPLAYS[0]:
-            self.draw_text('YOU WON!!!', text_pos=(self.screen.get_width()/2, self.screen.get_height()/2), text_size=60)
-        pygame.display.update()
-        self.clock.tick(self.fps)
+        return [header_rect]
+
+    def _find_dirty_tiles(self) -> None | list[int]:
+        """
+        Finds the ids of the tiles whose status or pressed state changed since they were last drawn, returns None if
+        the board has not been drawn at its current size
+        """
+        if self.drawn_status is None or self.drawn_status.shape != self.board.status.shape:
+            return None
+        changed = (self.board.status != self.drawn_status) | (self.board.pressed != self.drawn_pressed)
+        return np.flatnonzero(changed).tolist()
 
     def draw_buttons(self) -> None:
-        for button_name, button in self.button_mapping.items():
-            if button.display != self.current_display:
+        self.drawn_button_state = tuple(button.pressed for button in self.button_mapping.values())
+        current_display = self.current_display
+        board_valid = self.board.valid
+        blit = self.screen.blit
+        for button in self.button_mapping.values():
+            if button.display != current_display:
                 continue
 
-            if not self.board.valid:
+            if not board_valid:
                 image = button.image_game_over
             elif button.pressed:
                 image = button.image_pressed
             else:
                 image = button.image_normal
-            self.screen.blit(image, button.pos)
+            blit(image, button.pos)
 
             if button.text_to_display is not None:
                 self.draw_text(button.text_to_display, text_size=button.text_size, 
                                bounding_box=button.get_bounding_box(), text_color=button.text_color)
 
-    def draw_counters(self) -> None:
+    def draw_counters(self, changed_only: bool = False) -> list[pygame.Rect]:
+        """
+        Draws the mine and time counters, returns the areas of the screen that were drawn. If changed_only is set, a
+        counter is only drawn when the digits it shows differ from the last time it was drawn
+        """
         # don't draw counters for settings menu
         if self.current_display == DISPLAYS[1]:
-            return
+            return []
+
+        drawn_rects = []
         
         # first draw the counter with the remaining mines
-        mines_remaining = len(self.board.tiles_with_mines) - self.board.get_flagged_mine_count()
-        mine_count_pos_x = self.screen.get_width()/2-HEADER_HEIGHT-COUNTER_WIDTH
-        mines_rect = pygame.Rect(mine_count_pos_x, HEADER_HEIGHT*0.1, COUNTER_WIDTH, COUNTER_HEIGHT)
-        base_x = mine_count_pos_x + (COUNTER_WIDTH - TOTAL_DIGIT_WIDTH*3 - DIGIT_GAP*2)/2
-        base_y = (HEADER_HEIGHT - TOTAL_DIGIT_HEIGHT)/2
-        pygame.draw.rect(self.screen, (0, 0, 0), mines_rect)
-        self._draw_counter_segments(mines_remaining, base_x, base_y)
+        mines_remaining = f'{min(len(self.board.tiles_with_mines) - self.board.get_flagged_mine_count(), 999):03d}'
+        if not changed_only or mines_remaining != self.drawn_mines_remaining:
+            self.drawn_mines_remaining = mines_remaining
+            drawn_rects.extend(self._draw_counter_segments(mines_remaining, self.mines_digits_x, self.counter_digits_y))
 
-        # then draw the timer
-        time_count_pos_x = self.screen.get_width()/2+HEADER_HEIGHT
-        time_rect = pygame.Rect(time_count_pos_x, HEADER_HEIGHT*0.1, COUNTER_WIDTH, COUNTER_HEIGHT)
-        pygame.draw.rect(self.screen, (0, 0, 0), time_rect)
-        if self.start_time is None:
-            current_game_time = 0
-        else:
-            current_game_time = int(round(self.current_game_time))
-        base_x = time_count_pos_x + (COUNTER_WIDTH - TOTAL_DIGIT_WIDTH*3 - DIGIT_GAP*2)/2 
-        base_y = (HEADER_HEIGHT - TOTAL_DIGIT_HEIGHT)/2
-        self._draw_counter_segments(current_game_time, base_x, base_y)
-
-    def _draw_counter_segments(self, value: int, base_x: float, base_y: float) -> None:
-        digits = str(min(value, 999)).zfill(3)
-        for digit_index, digit in enumerate(digits):
-            segs_to_display = SEGMENTS_TO_DISPLAY[int(digit)]
-            for seg_index, seg in enumerate(segs_to_display):
-                if not seg:
-                    continue
-                seg_x, seg_y, rotate = SEGMENT_POSITION_SIZE[seg_index]
+        # then draw the timer, which only changes when the whole seconds tick over
+        if not changed_only or self.game_seconds != self.drawn_game_seconds:
+            self.drawn_game_seconds = self.game_seconds
+            drawn_rects.extend(self._draw_counter_segments(f'{min(self.game_seconds, 999):03d}', self.time_digits_x, self.counter_digits_y))
 
-                if rotate:
-                    image = self.segment_display_rot
-                else:
-                    image = self.segment_display
-                x = base_x + digit_index*(TOTAL_DIGIT_WIDTH+DIGIT_GAP)
-                self.screen.blit(image, (seg_x+x, seg_y+base_y))
+        return drawn_rects
 
-    def draw_tiles(self) -> None: 
+    def _draw_counter_segments(self, digits: str, base_x: float, base_y: float) -> list[pygame.Rect]:
+        """
+        Draws the digits over the counter background, each digit surface covers the one drawn before it so nothing needs
+        clearing first. Returns the areas of the screen that were drawn
+        """
+        digit_surfaces = self.digit_surfaces
+        return self.screen.blits([(digit_surfaces[int(digit)], (base_x + digit_index*(TOTAL_DIGIT_WIDTH+DIGIT_GAP), base_y))
+                                  for digit_index, digit in enumerate(digits)])
+
+    def draw_tiles(self, tile_ids: Optional[list[int]] = None) -> list[pygame.Rect]: 
+        """
+        Draws the tiles in tile_ids, returns the areas of the screen that were drawn. If not given, draws every tile that
+        differs from the board background, which must have been drawn first by draw_layout
+        """
         # don't draw tiles for settings menu
         if self.current_display == DISPLAYS[1]:
-            return
+            return []
+
+        # remember what is being drawn so the next frame only needs to draw tiles that change
+        self.drawn_status = self.board.status.copy()
+        self.drawn_pressed = self.board.pressed.copy()
+        if tile_ids is None:
+            tile_ids = np.flatnonzero((self.board.status != UNCHECKED) | self.board.pressed).tolist()
+        if not tile_ids:
+            return []
+
+        # collect every tile and number blit so each layer is drawn with a single blits call
+        tile_blits = []
+        number_blits = []
+
+        # local names for everything the loop touches, so each tile avoids repeated attribute lookups
+        tile_positions = self.tile_positions
+        tile_resources = self.tile_resources
+        number_surfaces = self.number_surfaces
+        tile_unchecked_pressed = self.tile_unchecked_pressed
+        tile_mine_checked = self.tile_mine_checked
+        add_tile = tile_blits.append
+        add_number = number_blits.append
+        statuses = self.board.status.ravel().tolist()
+        mines = self.board.mine.ravel().tolist()
+        adjacents = self.board.adjacent.ravel().tolist()
+        presses = self.board.pressed.ravel().tolist()
+
+        for tile_id in tile_ids:
+            tile_pos = tile_positions[tile_id]
+            status = statuses[tile_id]
+            # first, determine what resource to display based on the tile status, only pressed and mine tiles differ from the table
+            if status == UNCHECKED and presses[tile_id]:
+                resource = tile_unchecked_pressed
+            elif status == CHECKED and mines[tile_id]:
+                resource = tile_mine_checked
+            else:
+                resource = tile_resources[status]
+            add_tile((resource, tile_pos))
 
-        for tile in self.board.tiles:
-            # first, determine what resource to display based on the tile status
-            if tile.status == TILE_STATES[0]:
-                if tile.pressed:
-                    resource = pygame.transform.flip(self.tile_unchecked, True, True)
-                else:
-                    resource = self.tile_unchecked
-                self.screen.blit(resource, (tile.col*self.user.tile_size+self.tile_start_pos[0], tile.row*self.user.tile_size+self.tile_start_pos[1]+HEADER_HEIGHT))
-            elif tile.status == TILE_STATES[1]:
-                if tile.mine:
-                    self.screen.blit(self.tile_mine_checked, (tile.col*self.user.tile_size+self.tile_start_pos[0], tile.row*self.user.tile_size+self.tile_start_pos[1]+HEADER_HEIGHT))
-                else:
-                    self.screen.blit(self.tile_checked, (tile.col*self.user.tile_size+self.tile_start_pos[0], tile.row*self.user.tile_size+self.tile_start_pos[1]+HEADER_HEIGHT))
-                if tile.adjacent_mines > 0:
-                    text_x = tile.col*self.user.tile_size + self.user.tile_size/2 + self.tile_start_pos[0]
-                    text_y = tile.row*self.user.tile_size + self.user.tile_size/2 + HEADER_HEIGHT +self.tile_start_pos[1]
-                    self.draw_text(str(tile.adjacent_mines), text_size=int(self.user.tile_size*0.8), text_pos=(text_x, text_y), 
-                                   font='Times New Roman', text_color=NUM_TEXT_COLOUR[tile.adjacent_mines])
-
-            elif tile.status == TILE_STATES[2]:
-                self.screen.blit(self.tile_flagged, (tile.col*self.user.tile_size+self.tile_start_pos[0], tile.row*self.user.tile_size+self.tile_start_pos[1] + HEADER_HEIGHT))
-            elif tile.status == TILE_STATES[3]:
-                self.screen.blit(self.tile_question, (tile.col*self.user.tile_size+self.tile_start_pos[0], tile.row*self.user.tile_size+self.tile_start_pos[1] + HEADER_HEIGHT))
+            if status == CHECKED and adjacents[tile_id] > 0:
+                number, offset = number_surfaces[adjacents[tile_id]]
+                add_number((number, (tile_pos[0] + offset[0], tile_pos[1] + offset[1])))
+
+        tile_rects = self.screen.blits(tile_blits)
+        self.screen.blits(number_blits, doreturn=False)
+        return tile_rects
 
     def draw_mines(self) -> None:
         if self.current_display == DISPLAYS[1]:
             return
         if self.board.valid:
             return
-        for tile in self.board.tiles:
-            if tile.mine:
-                mine_x = tile.col*self.user.tile_size + self.tile_start_pos[0] + (self.user.tile_size - self.mine.get_width())/2
-                mine_y = tile.row*self.user.tile_size + self.tile_start_pos[1] + (self.user.tile_size - self.mine.get_height())/2 + HEADER_HEIGHT
-                self.screen.blit(self.mine, (mine_x, mine_y))
-                continue
+        tile_positions = self.tile_positions
+        mine_offset_x, mine_offset_y = self.mine_offset
+        for tile_id in np.flatnonzero(self.board.mine).tolist():
+            tile_pos = tile_positions[tile_id]
+            self.screen.blit(self.mine, (tile_pos[0] + mine_offset_x, tile_pos[1] + mine_offset_y))
             
-            # draw and X on any tiles that were flagged as mines and not actually mines
-            if tile.status == TILE_STATES[2] and not tile.mine:
-                text_x = tile.col*self.user.tile_size + self.tile_start_pos[0] + self.user.tile_size/2
-                text_y = tile.row*self.user.tile_size + self.tile_start_pos[1] + self.user.tile_size/2 + HEADER_HEIGHT
-
-                self.draw_text('X', text_size=int(self.user.tile_size*0.8), text_pos=(text_x, text_y), font='Arial')
+        # draw and X on any tiles that were flagged as mines and not actually mines
+        wrong_flag, offset = self.wrong_flag_surface
+        for tile_id in np.flatnonzero((self.board.status == FLAGGED) & ~self.board.mine).tolist():
+            tile_pos = tile_positions[tile_id]
+            self.screen.blit(wrong_flag, (tile_pos[0] + offset[0], tile_pos[1] + offset[1]))
 
     def draw_layout(self) -> None:
-        # draw the return to game button
-        self.screen.fill(SCREEN_FILL)
+        # the game display starts from the pre-rendered background with every tile unchecked
+        if self.current_display == DISPLAYS[0]:
+            self.screen.blit(self.board_background, (0, 0))
+        else:
+            self.screen.fill(SCREEN_FILL)
         if self.current_display == DISPLAYS[1]:
             # draw settings sub-menu
             settings_menu_rect = pygame.Rect(SETTINGS_INSET, SETTINGS_INSET, self.settings_submenu_width, self.settings_submenu_height)
@@ -474,15 +603,34 @@ class MineSweeper:
             height = self.board.height
             mines = self.board.mine_count
         
-        self.user.tile_size = min(screen_width / width, screen_height / height)
+        # whole pixel tiles line up exactly, with no gaps or overlaps from truncating fractional positions when blitting
+        self.user.tile_size = int(min(screen_width / width, screen_height / height))
         
         self.tile_start_pos = [
-            (screen_width - self.user.tile_size*width)/2,
-            (screen_height - self.user.tile_size*height)/2
+            int(screen_width - self.user.tile_size*width)//2,
+            int(screen_height - self.user.tile_size*height)//2
         ]
 
+        # tile positions only change with the board or tile size, so work them out here rather than every frame
+        col_px = [col*self.user.tile_size + self.tile_start_pos[0] for col in range(width)]
+        row_py = [row*self.user.tile_size + self.tile_start_pos[1] + HEADER_HEIGHT for row in range(height)]
+        self.tile_positions = [(x, y) for y in row_py for x in col_px]
+
         return width, height, mines
 
+    def _determine_header_positions(self) -> None:
+        """
+        Works out where the mine and time counters sit in the header, these only depend on the screen width
+        """
+        mine_count_pos_x = self.screen.get_width()/2-HEADER_HEIGHT-COUNTER_WIDTH
+        time_count_pos_x = self.screen.get_width()/2+HEADER_HEIGHT
+        digit_inset = (COUNTER_WIDTH - TOTAL_DIGIT_WIDTH*3 - DIGIT_GAP*2)/2
+        self.mines_rect = pygame.Rect(mine_count_pos_x, HEADER_HEIGHT*0.1, COUNTER_WIDTH, COUNTER_HEIGHT)
+        self.time_rect = pygame.Rect(time_count_pos_x, HEADER_HEIGHT*0.1, COUNTER_WIDTH, COUNTER_HEIGHT)
+        self.mines_digits_x = mine_count_pos_x + digit_inset
+        self.time_digits_x = time_count_pos_x + digit_inset
+        self.counter_digits_y = (HEADER_HEIGHT - TOTAL_DIGIT_HEIGHT)/2
+
     def _determine_settings_positions(self) -> None:
         self.settings_submenu_width = self.screen.get_width()/2-SETTINGS_INSET*1.5
         self.settings_submenu_height = self.screen.get_height()-SETTINGS_INSET*2
@@ -654,13 +802,67 @@ class MineSweeper:
 
     def _load_resources(self) -> None:
         self.tile_unchecked = self._scale_resource(pygame.image.load('resources/tile_unchecked.png'))
+        self.tile_unchecked_pressed = pygame.transform.flip(self.tile_unchecked, True, True)
         self.tile_checked = self._scale_resource(pygame.image.load('resources/tile_checked.png'))
         self.tile_flagged = self._scale_resource(pygame.image.load('resources/tile_flagged.png'))
         self.tile_question = self._scale_resource(pygame.image.load('resources/tile_question.png'))
         self.tile_mine_checked = self._scale_resource(pygame.image.load('resources/tile_mine_checked.png'))
         self.mine = self._scale_resource(pygame.image.load('resources/mine.png'), scaling=0.8)
+        self.mine_offset = ((self.user.tile_size - self.mine.get_width())/2, (self.user.tile_size - self.mine.get_height())/2)
         self.segment_display = self._scale_resource(pygame.image.load('resources/segment_display.png'), target_width=SEGMENT_WIDTH)
         self.segment_display_rot = pygame.transform.rotate(self.segment_display, 90.0)
+        self.tile_resources = (self.tile_unchecked, self.tile_checked, self.tile_flagged, self.tile_question)
+        self._render_numbers()
+        self._render_digits()
+        self._render_board_background()
+
+    def _render_digits(self) -> None:
+        """
+        Builds each seven segment digit from its segments once, on the black counter background, so a counter digit is
+        a single blit
+        """
+        self.digit_surfaces = []
+        for digit in range(10):
+            digit_surface = pygame.Surface((TOTAL_DIGIT_WIDTH, TOTAL_DIGIT_HEIGHT)).convert()
+            digit_surface.fill((0, 0, 0))
+            for seg_index, seg in enumerate(SEGMENTS_TO_DISPLAY[digit]):
+                if not seg:
+                    continue
+                seg_x, seg_y, rotate = SEGMENT_POSITION_SIZE[seg_index]
+
+                if rotate:
+                    image = self.segment_display_rot
+                else:
+                    image = self.segment_display
+                digit_surface.blit(image, (seg_x, seg_y))
+            self.digit_surfaces.append(digit_surface)
+
+    def _render_board_background(self) -> None:
+        """
+        Renders the game display with every tile unchecked and empty counters, so a full redraw only needs to draw the tiles
+        that differ from it. Must be redone whenever the board size, tile size or tile resources change
+        """
+        self.board_background = pygame.Surface(self.screen.get_size())
+        self.board_background.fill(SCREEN_FILL)
+        pygame.draw.rect(self.board_background, (0, 0, 0), self.mines_rect)
+        pygame.draw.rect(self.board_background, (0, 0, 0), self.time_rect)
+        self.board_background.blits([(self.tile_unchecked, tile_pos) for tile_pos in self.tile_positions], doreturn=False)
+
+    def _render_numbers(self) -> None:
+        """
+        Renders the adjacent mine numbers and the X marking a wrong flag once for the current tile size, along with the
+        offset that centers each one in a tile
+        """
+        font_obj = self._get_font('Times New Roman', int(self.user.tile_size*0.8))
+        self.number_surfaces = [None]
+        for num in range(1, 9):
+            text_surface_obj = font_obj.render(str(num), True, NUM_TEXT_COLOUR[num])
+            offset = ((self.user.tile_size - text_surface_obj.get_width())/2, (self.user.tile_size - text_surface_obj.get_height())/2)
+            self.number_surfaces.append((text_surface_obj, offset))
+
+        text_surface_obj = self._get_font('Arial', int(self.user.tile_size*0.8)).render('X', True, (0, 0, 0))
+        offset = ((self.user.tile_size - text_surface_obj.get_width())/2, (self.user.tile_size - text_surface_obj.get_height())/2)
+        self.wrong_flag_surface = (text_surface_obj, offset)
 
     def _scale_resource(self, image: pygame.Surface, scaling: float = 1.0, target_width: None | float = None) -> pygame.Surface:
         width = image.get_width()
@@ -669,7 +871,9 @@ class MineSweeper:
             ratio = self.user.tile_size / width
         else:
             ratio = target_width / width
-        image = pygame.transform.scale(image, (width*ratio*scaling, height*ratio*scaling))
+        # round rather than let pygame truncate, width*ratio can land just below the tile size and leave a 1px gap
+        # between tiles. Convert to the display pixel format once here so blits do not have to convert every frame
+        image = pygame.transform.scale(image, (round(width*ratio*scaling), round(height*ratio*scaling))).convert_alpha()
         return image
 
     def _find_tile_by_row_col(self, row: int, col: int) -> Tuple[float, float]:
@@ -682,7 +886,7 @@ class MineSweeper:
         """
         finds the row and col of the tile click
         """
-        return (int((mouse_pos[1] - HEADER_HEIGHT - self.tile_start_pos[1]) // self.user.tile_size), int((mouse_pos[0] - self.tile_start_pos[0])  // self.user.tile_size))
+        return ((mouse_pos[1] - HEADER_HEIGHT - self.tile_start_pos[1]) // self.user.tile_size, (mouse_pos[0] - self.tile_start_pos[0]) // self.user.tile_size)
 
     def draw_text(self, message: str, bounding_box: Optional[tuple[float]] = None, inset: float = 0.15,
                   text_size: Optional[int] = None, text_pos: Optional[tuple] = None, font: str = 'Calibri', 
@@ -702,24 +906,31 @@ class MineSweeper:
             raise ValueError(f'text inset of bounding box cannot exceed 25% of objects height or width')
         
         if bounding_box is not None: 
-            if text_size is None:              
-                text_size = int(bounding_box[3]*(1-inset))
-            while True:
-                font_obj = pygame.font.SysFont(font, text_size)
-                text_surface_obj = font_obj.render(str(message), True, text_color)
-                if text_surface_obj.get_width() > bounding_box[2]*(1-inset):
-                    # get new width
-                    ratio = text_surface_obj.get_width() / (bounding_box[2]*(1-inset))
-                    text_size = int(text_size/ratio)
-                    continue
-                break
+            # the fitted text only depends on the size of the bounding box, not where it is
+            key = (message, font, text_size, text_color, bounding_box[2], bounding_box[3], inset)
+            text_surface_obj = self.text_surfaces.get(key)
+            if text_surface_obj is None:
+                if text_size is None:              
+                    text_size = int(bounding_box[3]*(1-inset))
+                while True:
+                    text_surface_obj = self._get_font(font, text_size).render(message, True, text_color)
+                    if text_surface_obj.get_width() > bounding_box[2]*(1-inset):
+                        # get new width
+                        ratio = text_surface_obj.get_width() / (bounding_box[2]*(1-inset))
+                        text_size = int(text_size/ratio)
+                        continue
+                    break
+                self._cache_text_surface(key, text_surface_obj)
             
             x = bounding_box[0] + (bounding_box[2] - text_surface_obj.get_width())/2
             y = bounding_box[1] + (bounding_box[3] - text_surface_obj.get_height())/2
 
         else:
-            font_obj = pygame.font.SysFont(font, text_size)
-            text_surface_obj = font_obj.render(str(message), True, text_color)
+            key = (message, font, text_size, text_color)
+            text_surface_obj = self.text_surfaces.get(key)
+            if text_surface_obj is None:
+                text_surface_obj = self._get_font(font, text_size).render(message, True, text_color)
+                self._cache_text_surface(key, text_surface_obj)
             
             if center:
                 text_width = text_surface_obj.get_width()
@@ -730,11 +941,28 @@ class MineSweeper:
                 x, y = text_pos
 
         self.screen.blit(text_surface_obj, (x, y))
+
+    def _get_font(self, font: str, text_size: int) -> pygame.font.Font:
+        """
+        Returns the system font at the given size, creating it only the first time it is asked for
+        """
+        key = (font, text_size)
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.SysFont(font, text_size)
+        return self.fonts[key]
+
+    def _cache_text_surface(self, key: tuple, text_surface_obj: pygame.Surface) -> None:
+        """
+        Stores rendered text for reuse, starting over once the cache is full so changing messages can't grow it forever
+        """
+        if len(self.text_surfaces) >= TEXT_CACHE_SIZE:
+            self.text_surfaces.clear()
+        self.text_surfaces[key] = text_surface_obj
 	
     def terminate_game(self) -> None:
         """Quits the program and ends the game."""
         pygame.quit()
-        sys.exit
+        sys.exit()
 
 
 if __name__ == "__main__":
@@ -22,6 +22,7 @@ SETTING_FILL = (255, 255, 255)
 SETTINGS_INSET = 10
 MAX_SCREEN_RATIO = 0.7
 DISPLAYS = ['game', 'settings']
+TEXT_CACHE_SIZE = 256  # number of rendered text surfaces kept before the cache is cleared
 
 # the colors for numbers showing the number of adjacent mines
 NUM_TEXT_COLOUR = {
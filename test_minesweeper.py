@@ -0,0 +1,55 @@
+"""
+test_minesweeper.py
+
+Tests for the MineSweeper drawing helpers, run headless on the dummy video driver with python -m unittest
+
+"""
+import os
+import unittest
+from types import SimpleNamespace
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from minesweeper import MineSweeper
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+# tile sizes where the unrounded scaled width lands just below the tile size for the tile images
+TILE_SIZES = (7, 14, 25, 28, 31, 50, 53, 56, 59, 62, 100, 106, 112, 118, 124, 200, 201, 212, 213, 224, 225, 236, 237,
+              248, 249)
+
+TILE_IMAGES = (
+    'tile_unchecked.png',
+    'tile_checked.png',
+    'tile_flagged.png',
+    'tile_question.png',
+    'tile_mine_checked.png',
+)
+
+
+class TestScaleResource(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        pygame.init()
+        # convert_alpha needs a display mode to convert to
+        pygame.display.set_mode((1, 1))
+        cls.images = {name: pygame.image.load(os.path.join(RESOURCES, name)) for name in TILE_IMAGES}
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        pygame.quit()
+
+    def test_tile_resources_fill_the_tile(self) -> None:
+        # only the tile size is needed to scale, so skip the window and database setup in __init__
+        minesweeper = MineSweeper.__new__(MineSweeper)
+        for tile_size in TILE_SIZES:
+            minesweeper.user = SimpleNamespace(tile_size=tile_size)
+            for name, image in self.images.items():
+                with self.subTest(tile_size=tile_size, image=name):
+                    self.assertEqual(minesweeper._scale_resource(image).get_size(), (tile_size, tile_size))
+
+
+if __name__ == '__main__':
+    unittest.main()